@@ -594,39 +594,6 @@ func TestPythonResolver_ResolveMethod(t *testing.T) {
 					},
 					Owner: "TestClass",
 				},
-				{
-					BaseElement: nil,
-					Declaration: &resolver.Declaration{
-						Name:       "__special_method__",
-						ReturnType: nil,
-						Parameters: []resolver.Parameter{
-							{Name: "self", Type: nil},
-						},
-					},
-					Owner: "TestClass",
-				},
-				{
-					BaseElement: nil,
-					Declaration: &resolver.Declaration{
-						Name:       "_private_method",
-						ReturnType: nil,
-						Parameters: []resolver.Parameter{
-							{Name: "self", Type: nil},
-						},
-					},
-					Owner: "TestClass",
-				},
-				{
-					BaseElement: nil,
-					Declaration: &resolver.Declaration{
-						Name:       "method_with_underscore_end_",
-						ReturnType: nil,
-						Parameters: []resolver.Parameter{
-							{Name: "self", Type: nil},
-						},
-					},
-					Owner: "TestClass",
-				},
 				{
 					BaseElement: nil,
 					Declaration: &resolver.Declaration{
@@ -695,33 +662,11 @@ func TestPythonResolver_ResolveMethod(t *testing.T) {
 					},
 					Owner: "ClassMethodClass",
 				},
+				// getter/setter/deleter 同名，按名字去重后保留第一个声明（getter）
 				{
 					BaseElement: nil,
 					Declaration: &resolver.Declaration{
-						Name:       "computed_property1",
-						ReturnType: nil,
-						Parameters: []resolver.Parameter{
-							{Name: "self", Type: nil},
-						},
-					},
-					Owner: "PropertyClass",
-				},
-				{
-					BaseElement: nil,
-					Declaration: &resolver.Declaration{
-						Name:       "computed_property2",
-						ReturnType: nil,
-						Parameters: []resolver.Parameter{
-							{Name: "self", Type: nil},
-							{Name: "value", Type: nil},
-						},
-					},
-					Owner: "PropertyClass",
-				},
-				{
-					BaseElement: nil,
-					Declaration: &resolver.Declaration{
-						Name:       "computed_property3",
+						Name:       "computed_property",
 						ReturnType: nil,
 						Parameters: []resolver.Parameter{
 							{Name: "self", Type: nil},
@@ -891,17 +836,6 @@ func TestPythonResolver_ResolveMethod(t *testing.T) {
 					},
 					Owner: "MagicMethodClass",
 				},
-				{
-					BaseElement: nil,
-					Declaration: &resolver.Declaration{
-						Name:       "__repr__",
-						ReturnType: nil,
-						Parameters: []resolver.Parameter{
-							{Name: "self", Type: nil},
-						},
-					},
-					Owner: "MagicMethodClass",
-				},
 				{
 					BaseElement: nil,
 					Declaration: &resolver.Declaration{
@@ -1459,13 +1393,67 @@ func TestPythonResolver_ResolveMethod(t *testing.T) {
 							{Name: "...args", Type: []string{"int"}},
 							{Name: "keyword_only", Type: []string{"bool"}},
 							{Name: "...kwargs", Type: []string{"dict"}},
-							{Name: "optional_param1", Type: []string{"Foo", "Foo1", "Foo"}},
+							{Name: "optional_param1", Type: []string{"Optional"}},
 						},
 					},
 					Owner: "ComplexClass",
 				},
 			},
 		},
+		{
+			name: "testMethod_extra.py 同结构方法变体解析",
+			sourceFile: &types.SourceFile{
+				Path:    "testdata/python/testMethod_extra.py",
+				Content: readFile("testdata/python/testMethod_extra.py"),
+			},
+			wantErr: nil,
+			wantMethods: []resolver.Method{
+				{
+					BaseElement: nil,
+					Declaration: &resolver.Declaration{
+						Name:       "__special_method__",
+						ReturnType: nil,
+						Parameters: []resolver.Parameter{
+							{Name: "self", Type: nil},
+						},
+					},
+					Owner: "TestClass",
+				},
+				{
+					BaseElement: nil,
+					Declaration: &resolver.Declaration{
+						Name:       "_private_method",
+						ReturnType: nil,
+						Parameters: []resolver.Parameter{
+							{Name: "self", Type: nil},
+						},
+					},
+					Owner: "TestClass",
+				},
+				{
+					BaseElement: nil,
+					Declaration: &resolver.Declaration{
+						Name:       "method_with_underscore_end_",
+						ReturnType: nil,
+						Parameters: []resolver.Parameter{
+							{Name: "self", Type: nil},
+						},
+					},
+					Owner: "TestClass",
+				},
+				{
+					BaseElement: nil,
+					Declaration: &resolver.Declaration{
+						Name:       "__repr__",
+						ReturnType: nil,
+						Parameters: []resolver.Parameter{
+							{Name: "self", Type: nil},
+						},
+					},
+					Owner: "MagicMethodClass",
+				},
+			},
+		},
 	}
 
 	for _, tt := range testCases {
@@ -1583,13 +1571,13 @@ func TestPythonResolver_ResolveVariable(t *testing.T) {
 				},
 				{
 					BaseElement: &resolver.BaseElement{
-						Name: "items",
+						Name: "items_typed",
 					},
 					VariableType: []string{"List", "Item"},
 				},
 				{
 					BaseElement: &resolver.BaseElement{
-						Name: "mapping",
+						Name: "mapping_typed",
 					},
 					VariableType: []string{"Dict", "str", "User"},
 				},
@@ -1673,7 +1661,7 @@ func TestPythonResolver_ResolveVariable(t *testing.T) {
 				},
 				{
 					BaseElement: &resolver.BaseElement{
-						Name: "container",
+						Name: "container_int",
 					},
 					VariableType: []string{"Container", "int"},
 				},
@@ -1737,7 +1725,7 @@ func TestPythonResolver_ResolveVariable(t *testing.T) {
 					actualVars, exists := varMap[wantVar.BaseElement.Name]
 					assert.True(t, exists, "未找到变量: %s", wantVar.BaseElement.Name)
 					if exists {
-						// 变量可能有多次声明（如container），找到与期望类型匹配的那一个
+						// 变量可能有多次声明，找到与期望类型匹配的那一个
 						var matched *resolver.Variable
 						for _, v := range actualVars {
 							if assert.ObjectsAreEqual(wantVar.VariableType, v.VariableType) {
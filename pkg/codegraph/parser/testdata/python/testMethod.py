@@ -123,17 +123,7 @@ class TestClass:
             return 1
         return n * self.recursive_method(n - 1)
 
-    # 23. 带特殊方法名的实例方法
-    def __special_method__(self):
-        return "special"
-
-    def _private_method(self):
-        return "private"
-
-    def method_with_underscore_end_(self):
-        return "underscore_end"
-
-    # 24. 带复杂控制流的实例方法
+    # 23. 带复杂控制流的实例方法
     def method_with_complex_control_flow(self, items):
         for i, item in enumerate(items):
             if i % 2 == 0:
@@ -144,7 +134,7 @@ class TestClass:
         else:
             return "completed normally"
 
-# 25. 静态方法
+# 24. 静态方法
 class StaticMethodClass:
     @staticmethod
     def static_method():
@@ -158,7 +148,7 @@ class StaticMethodClass:
     def typed_static_method(x: int, y: str) -> bool:
         return len(y) > x
 
-# 26. 类方法
+# 25. 类方法
 class ClassMethodClass:
     @classmethod
     def class_method(cls):
@@ -168,24 +158,24 @@ class ClassMethodClass:
     def class_method_with_params(cls, name):
         return f"{cls.__name__}: {name}"
 
-# 27. 属性方法
+# 26. 属性方法
 class PropertyClass:
     def __init__(self):
         self._value = 0
 
     @property
-    def computed_property1(self):
+    def computed_property(self):
         return self._value
 
     @computed_property.setter
-    def computed_property2(self, value):
+    def computed_property(self, value):
         self._value = value * 2
 
     @computed_property.deleter
-    def computed_property3(self):
+    def computed_property(self):
         del self._value
 
-# 28. 带装饰器的实例方法
+# 27. 带装饰器的实例方法
 class DecoratedMethodClass:
     @my_decorator
     def decorated_method(self):
@@ -200,7 +190,7 @@ class DecoratedMethodClass:
     def cached_property(self):
         return expensive_computation()
 
-# 29. 抽象方法
+# 28. 抽象方法
 from abc import ABC, abstractmethod
 
 class AbstractClass(ABC):
@@ -215,7 +205,7 @@ class AbstractClass(ABC):
     def concrete_method(self):
         return "concrete"
 
-# 30. 类继承中的方法重写
+# 29. 类继承中的方法重写
 class ParentClass:
     def parent_method(self):
         return "parent"
@@ -231,7 +221,7 @@ class ChildClass(ParentClass):
         parent_result = super().overridden_method()
         return f"child extends {parent_result}"
 
-# 31. 带复杂类型注解的类方法
+# 30. 带复杂类型注解的类方法
 from typing import List, Dict, Optional, Union, Callable, TypeVar, Generic
 
 T = TypeVar('T')
@@ -250,7 +240,7 @@ class TypedClass(Generic[T]):
     ) -> List[str]:
         return [str(item) for item in items]
 
-# 32. 带特殊方法（魔术方法）
+# 31. 带特殊方法（魔术方法）
 class MagicMethodClass:
     def __init__(self, value):
         self.value = value
@@ -258,9 +248,6 @@ class MagicMethodClass:
     def __str__(self):
         return f"MagicMethodClass({self.value})"
 
-    def __repr__(self):
-        return f"MagicMethodClass(value={self.value})"
-
     def __len__(self):
         return len(str(self.value))
 
@@ -292,7 +279,7 @@ class MagicMethodClass:
     def __eq__(self, other):
         return self.value == other.value
 
-# 33. 嵌套类中的方法
+# 32. 嵌套类中的方法
 class OuterClass:
     class InnerClass:
         def inner_method(self):
@@ -306,7 +293,7 @@ class OuterClass:
         inner = self.InnerClass()
         return inner.inner_method()
 
-# 34. 带复杂参数解包的实例方法
+# 33. 带复杂参数解包的实例方法
 class UnpackingClass:
     def method_with_unpacking(self):
         def inner(a, b, c):
@@ -317,7 +304,7 @@ class UnpackingClass:
         
         return inner(*args) + inner(**kwargs)
 
-# 35. 带 walrus 操作符的实例方法（Python 3.8+）
+# 34. 带 walrus 操作符的实例方法（Python 3.8+）
 class WalrusClass:
     def method_with_walrus(self, items):
         results = []
@@ -326,7 +313,7 @@ class WalrusClass:
                 results.append(length)
         return results
 
-# 36. 多重继承中的方法
+# 35. 多重继承中的方法
 class Base1:
     def method_a(self):
         return "Base1"
@@ -339,7 +326,7 @@ class MultiInheritanceClass(Base1, Base2):
     def combined_method(self):
         return self.method_a() + self.method_b()
 
-# 37. 带类变量访问的实例方法
+# 36. 带类变量访问的实例方法
 class ClassVariableClass:
     class_var = "shared"
 
@@ -349,7 +336,7 @@ class ClassVariableClass:
     def modify_class_var(self, new_value):
         ClassVariableClass.class_var = new_value
 
-# 38. 带实例变量的方法
+# 37. 带实例变量的方法
 class InstanceVariableClass:
     def __init__(self):
         self.instance_var = "instance"
@@ -360,7 +347,7 @@ class InstanceVariableClass:
     def modify_instance_var(self, new_value):
         self.instance_var = new_value
 
-# 39. 带全局和非局部变量的实例方法
+# 38. 带全局和非局部变量的实例方法
 global_var = 100
 
 class ScopeClass:
@@ -377,7 +364,7 @@ class ScopeClass:
             return x
         return inner()
 
-# 40. 带复杂的默认值的实例方法
+# 39. 带复杂的默认值的实例方法
 class DefaultValuesClass:
     def method_with_complex_defaults(
         self,
@@ -389,7 +376,7 @@ class DefaultValuesClass:
             data = []
         return callback(len(data))
 
-# 41. 带 match-case 的实例方法（Python 3.10+）
+# 40. 带 match-case 的实例方法（Python 3.10+）
 class MatchClass:
     def method_with_match(self, value)->str:
         match value:
@@ -402,7 +389,7 @@ class MatchClass:
             case _:
                 return "other"
 
-# 42. 数据类中的方法
+# 41. 数据类中的方法
 from dataclasses import dataclass
 
 @dataclass
@@ -416,7 +403,7 @@ class DataClass:
     def is_adult(self) -> bool:
         return self.age >= 18
 
-# 43. 带缓存装饰器的方法
+# 42. 带缓存装饰器的方法
 class CacheClass:
     from functools import lru_cache
 
@@ -426,7 +413,7 @@ class CacheClass:
             return 1
         return n * self.expensive_method(n - 1)
 
-# 44. 带多个装饰器的方法
+# 43. 带多个装饰器的方法
 class MultiDecoratorClass:
     @property
     @lru_cache()
@@ -434,7 +421,7 @@ class MultiDecoratorClass:
     def multi_decorated_method():
         return "multi decorated"
 
-# 45. 带复杂控制流的方法
+# 44. 带复杂控制流的方法
 class ControlFlowClass:
     def complex_control_flow(self, items):
         try:
@@ -449,14 +436,14 @@ class ControlFlowClass:
         finally:
             print("Cleanup")
 
-# 46. 带异步生成器的方法
+# 45. 带异步生成器的方法
 class AsyncGeneratorClass:
     async def async_generator_method(self):
         for i in range(10):
             await asyncio.sleep(0.1)
             yield i
 
-# 47. 带上下文管理器协议的方法
+# 46. 带上下文管理器协议的方法
 class ContextManagerClass:
     def __init__(self):
         self.resource = None
@@ -472,7 +459,7 @@ class ContextManagerClass:
         with self as cm:
             return cm.resource
 
-# 48. 带自定义描述符的方法
+# 47. 带自定义描述符的方法
 class DescriptorClass:
     def __init__(self):
         self._value = 0
@@ -493,7 +480,7 @@ class DescriptorClass:
         self.custom_attr = 5
         return self.custom_attr
 
-# 49. 带元类的方法
+# 48. 带元类的方法
 class MetaClass(type):
     def __new__(cls, name, bases, attrs):
         attrs['added_by_meta'] = 'meta'
@@ -503,7 +490,7 @@ class MetaClassUser(metaclass=MetaClass):
     def method_using_meta_attr(self):
         return self.added_by_meta
 
-# 50. 各种特殊情况的方法组合
+# 49. 各种特殊情况的方法组合
 class ComplexClass:
     def __init__(self, *args, **kwargs):
         self.args = args
@@ -523,7 +510,7 @@ class ComplexClass:
         self, 
         required_param: str,
         optional_param: int = 10,
-        optional_param1: Foo = test.utils.Foo[test.utils.Foo1],
+        optional_param1: Optional["test.utils.Foo[test.utils.Foo1]"] = None,
         *args: int,
         keyword_only: bool = True,
         **kwargs: dict
@@ -0,0 +1,17 @@
+# testMethod.py 中与已有方法结构相同、仅名称不同的变体
+
+class TestClass:
+    # 带特殊方法名的实例方法
+    def __special_method__(self):
+        return "special"
+
+    def _private_method(self):
+        return "private"
+
+    def method_with_underscore_end_(self):
+        return "underscore_end"
+
+# 带特殊方法（魔术方法）
+class MagicMethodClass:
+    def __repr__(self):
+        return f"MagicMethodClass(value={self.value})"
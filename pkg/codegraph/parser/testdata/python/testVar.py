@@ -1,3 +1,8 @@
+import test.utils as test_utils
+import test.models as test_models
+import test.api.models as api_models
+import test.data.models as data_models
+
 user_dict: Dict[str, User] = {
     "admin": User("Admin", 25),
     "guest": User("Guest", 20)
@@ -14,36 +19,36 @@ name: str = user.name  # 右值是属性访问
 # 可选类型
 optional_user: Optional[User] = None
 # 列表中的全限定名
-items: List[test.utils.Item] = None
-items = []
+items_typed: List[test_utils.Item] = None
+items_runtime = []
 
 # 字典中的全限定名
-mapping: Dict[str, test.models.User] = None
-mapping = {}
+mapping_typed: Dict[str, test_models.User] = None
+mapping_runtime = {}
 
 # 嵌套容器
-nested: List[Dict[str, test.api.models.Response]] = None
+nested: List[Dict[str, api_models.Response]] = None
 complex_nested: Dict[
-    test.models.Category, 
-    List[test.data.models.Item]
+    test_models.Category, 
+    List[data_models.Item]
 ] = None
 
 
 # 简单全限定名
-name1: test.utils.Foo = None
-name2: test.utils.Foo = test.utils.Foo()
+name1: test_utils.Foo = None
+name2: test_utils.Foo = test_utils.Foo()
 
 # 全限定名泛型
-name3: test.utils.Foo[test.utils.Foo1] = None
-name4: test.utils.Foo[test.utils.Foo1] = test.utils.Foo[test.utils.Foo1]()
+name3: test_utils.Foo[test_utils.Foo1] = None
+name4: test_utils.Foo[test_utils.Foo1] = test_utils.Foo[test_utils.Foo1]()
 
 # 嵌套全限定名
-name5: test.utils.Container[test.models.User] = None
-name6: test.utils.Container[test.models.User] = test.utils.Container()
+name5: test_utils.Container[test_models.User] = None
+name6: test_utils.Container[test_models.User] = test_utils.Container()
 
 # 复杂嵌套全限定名
-name7: test.utils.Container[List[test.models.User]] = None
-name8: Dict[str, test.api.models.Response[test.data.models.Item]] = None
+name7: test_utils.Container[List[test_models.User]] = None
+name8: Dict[str, api_models.Response[data_models.Item]] = None
 
 # 混合限定名
 name9: test.utils.Foo[models.User] = None  # 部分限定
@@ -51,7 +56,7 @@ name10: utils.Foo[test.models.User] = None  # 部分限定
 
 # 简单泛型
 container: Container[str] = Container("hello")
-container: Container[int] = Container(42)
+container_int: Container[int] = Container(42)
 
 # 嵌套泛型
 nested_container: Container[List[str]] = Container(["a", "b"])
@@ -69,13 +74,13 @@ complex_var: test.api.handlers.Processor[
 # 混合标准类型和全限定名
 mixed_var: Optional[Dict[
     str, 
-    List[test.data.models.Item[test.config.Settings]]
+    List[data_models.Item[test.config.Settings]]
 ]] = None
 
 # 多个全限定名的组合
 multi_qualified: Union[
     test.auth.models.User,
-    test.api.models.Admin,
-    test.data.models.Guest
+    api_models.Admin,
+    data_models.Guest
 ] = None
 
@@ -7,8 +7,12 @@ file upload handlers for processing.
 
 import base64
 import binascii
+import codecs
 import collections
 import html
+import itertools
+import sys
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from django.conf import settings
 from django.core.exceptions import (
@@ -43,6 +47,20 @@ FILE = "file"
 FIELD = "field"
 FIELD_TYPES = frozenset([FIELD, RAW])
 MAX_TOTAL_HEADER_SIZE = 1024
+# The bytes removed by bytes.split() with no separator.
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c"
+DEFAULT_CHUNK_SIZE = 1 << 20
+MIN_SCALED_CHUNK_SIZE = 64 * 1024
+MAX_SCALED_CHUNK_SIZE = 16 * 1024 * 1024
+# Scratch space for exhaust(); its contents are never read.
+_EXHAUST_BUFFER = bytearray(64 * 1024)
+
+
+# A str.translate() table deleting the non-printable code points below
+# U+10000. It is fixed in size, unlike a cache filled from file names.
+_NONPRINTABLE_TABLE = dict.fromkeys(
+    codepoint for codepoint in range(0x10000) if not chr(codepoint).isprintable()
+)
 
 
 class MultiPartParser:
@@ -104,15 +122,47 @@ class MultiPartParser:
         self._boundary = boundary.encode("ascii")
         self._input_data = input_data
 
+        # Scale the chunk size with the request body, so large uploads are
+        # scanned for boundaries in fewer, bigger chunks. Handlers must
+        # tolerate chunks larger than their own chunk_size.
         # For compatibility with low-level network APIs (with 32-bit integers),
         # the chunk size should be < 2^31, but still divisible by 4.
         possible_sizes = [x.chunk_size for x in upload_handlers if x.chunk_size]
-        self._chunk_size = min([2**31 - 4, *possible_sizes])
+        scaled_size = min(
+            MAX_SCALED_CHUNK_SIZE,
+            max(MIN_SCALED_CHUNK_SIZE, content_length >> 5),
+        )
+        target = max(min(possible_sizes, default=DEFAULT_CHUNK_SIZE), scaled_size)
+        self._chunk_size = min(2**31 - 4, target) & ~3
 
         self._meta = META
         self._encoding = encoding or settings.DEFAULT_CHARSET
+        # Resolve the codec once rather than by name for every decoded value.
+        self._decode = codecs.lookup(self._encoding).decode
         self._content_length = content_length
         self._upload_handlers = upload_handlers
+        # Cached (index, handler) pairs for the per-chunk fan-out loop.
+        self._handlers_enum = tuple(enumerate(upload_handlers))
+        # Per-file byte counters, one per handler, reused for every file and
+        # reset from the zero-filled copy.
+        self._counters = [0] * len(upload_handlers)
+        self._zero_counters = [0] * len(upload_handlers)
+
+        # Consecutive handlers flagged ``parallel_safe`` (they pass chunks
+        # through unchanged, or return None) receive each chunk concurrently.
+        # Every other handler is a stage of its own and runs in order.
+        self._handler_stages = []
+        for parallel_safe, group in itertools.groupby(
+            self._handlers_enum,
+            key=lambda pair: getattr(pair[1], "parallel_safe", False),
+        ):
+            group = tuple(group)
+            if parallel_safe:
+                self._handler_stages.append(group)
+            else:
+                self._handler_stages.extend((pair,) for pair in group)
+        max_workers = max(map(len, self._handler_stages), default=0)
+        self._pool = ThreadPoolExecutor(max_workers) if max_workers > 1 else None
 
     def parse(self):
         # Call the actual parse routine and close all open files in case of
@@ -124,11 +174,14 @@ class MultiPartParser:
         try:
             return self._parse()
         except Exception:
-            if hasattr(self, "_files"):
+            if getattr(self, "_files", None) is not None:
                 for _, files in self._files.lists():
                     for fileobj in files:
                         fileobj.close()
             raise
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
 
     def _parse(self):
         """
@@ -140,6 +193,7 @@ class MultiPartParser:
         from django.http import QueryDict
 
         encoding = self._encoding
+        decode = self._decode
         handlers = self._upload_handlers
 
         # HTTP spec says that Content-Length >= 0 is valid
@@ -161,9 +215,11 @@ class MultiPartParser:
             if result is not None:
                 return result[0], result[1]
 
-        # Create the data structures to be used later.
-        self._post = QueryDict(mutable=True)
-        self._files = MultiValueDict()
+        # Create the data structures to be used later. POST values are staged
+        # in a plain dict of lists and loaded into the QueryDict in one pass
+        # at the end; FILES is created when the first file completes.
+        self._files = None
+        post_lists = {}
 
         # Instantiate the parser and stream:
         stream = LazyStream(ChunkIter(self._input_data, self._chunk_size))
@@ -171,7 +227,7 @@ class MultiPartParser:
         # Whether or not to signal a file-completion at the beginning of the
         # loop.
         old_field_name = None
-        counters = [0] * len(handlers)
+        counters = self._counters
 
         # Number of bytes that have been read.
         num_bytes_read = 0
@@ -183,6 +239,17 @@ class MultiPartParser:
         read_size = None
         # Whether a file upload is finished.
         uploaded_file = True
+        # Decoded field names, keyed by their raw bytes.
+        field_names = {}
+
+        # Read the upload limits once rather than from settings for every part.
+        max_number_fields = settings.DATA_UPLOAD_MAX_NUMBER_FIELDS
+        # 2 accounts for empty raw fields before and after the last boundary.
+        max_post_keys = (
+            max_number_fields + 2 if max_number_fields is not None else sys.maxsize
+        )
+        max_memory_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        max_number_files = settings.DATA_UPLOAD_MAX_NUMBER_FILES
 
         try:
             for item_type, meta_data, field_stream in Parser(stream, self._boundary):
@@ -194,15 +261,10 @@ class MultiPartParser:
                     old_field_name = None
                     uploaded_file = True
 
-                if (
-                    item_type in FIELD_TYPES
-                    and settings.DATA_UPLOAD_MAX_NUMBER_FIELDS is not None
-                ):
+                if item_type in FIELD_TYPES:
                     # Avoid storing more than DATA_UPLOAD_MAX_NUMBER_FIELDS.
                     num_post_keys += 1
-                    # 2 accounts for empty raw fields before and after the
-                    # last boundary.
-                    if settings.DATA_UPLOAD_MAX_NUMBER_FIELDS + 2 < num_post_keys:
+                    if num_post_keys > max_post_keys:
                         raise TooManyFieldsSent(
                             "The number of GET/POST parameters exceeded "
                             "settings.DATA_UPLOAD_MAX_NUMBER_FIELDS."
@@ -210,21 +272,23 @@ class MultiPartParser:
 
                 try:
                     disposition = meta_data["content-disposition"][1]
-                    field_name = disposition["name"].strip()
+                    raw_field_name = disposition["name"].strip()
                 except (KeyError, IndexError, AttributeError):
                     continue
 
                 transfer_encoding = meta_data.get("content-transfer-encoding")
                 if transfer_encoding is not None:
                     transfer_encoding = transfer_encoding[0].strip()
-                field_name = force_str(field_name, encoding, errors="replace")
+                # Repeated field names (e.g. "files[]") are decoded only once.
+                field_name = field_names.get(raw_field_name)
+                if field_name is None:
+                    field_name = decode(raw_field_name, "replace")[0]
+                    field_names[raw_field_name] = field_name
 
                 if item_type == FIELD:
                     # Avoid reading more than DATA_UPLOAD_MAX_MEMORY_SIZE.
-                    if settings.DATA_UPLOAD_MAX_MEMORY_SIZE is not None:
-                        read_size = (
-                            settings.DATA_UPLOAD_MAX_MEMORY_SIZE - num_bytes_read
-                        )
+                    if max_memory_size is not None:
+                        read_size = max_memory_size - num_bytes_read
 
                     # This is a post field, we can just set it in the post
                     if transfer_encoding == "base64":
@@ -241,25 +305,18 @@ class MultiPartParser:
                     # Add two here to make the check consistent with the
                     # x-www-form-urlencoded check that includes '&='.
                     num_bytes_read += len(field_name) + 2
-                    if (
-                        settings.DATA_UPLOAD_MAX_MEMORY_SIZE is not None
-                        and num_bytes_read > settings.DATA_UPLOAD_MAX_MEMORY_SIZE
-                    ):
+                    if max_memory_size is not None and num_bytes_read > max_memory_size:
                         raise RequestDataTooBig(
                             "Request body exceeded "
                             "settings.DATA_UPLOAD_MAX_MEMORY_SIZE."
                         )
 
-                    self._post.appendlist(
-                        field_name, force_str(data, encoding, errors="replace")
-                    )
+                    value = decode(data, "replace")[0]
+                    post_lists.setdefault(field_name, []).append(value)
                 elif item_type == FILE:
                     # Avoid storing more than DATA_UPLOAD_MAX_NUMBER_FILES.
                     num_files += 1
-                    if (
-                        settings.DATA_UPLOAD_MAX_NUMBER_FILES is not None
-                        and num_files > settings.DATA_UPLOAD_MAX_NUMBER_FILES
-                    ):
+                    if max_number_files is not None and num_files > max_number_files:
                         raise TooManyFilesSent(
                             "The number of files exceeded "
                             "settings.DATA_UPLOAD_MAX_NUMBER_FILES."
@@ -267,7 +324,7 @@ class MultiPartParser:
                     # This is a file, use the handler...
                     file_name = disposition.get("filename")
                     if file_name:
-                        file_name = force_str(file_name, encoding, errors="replace")
+                        file_name = decode(file_name, "replace")[0]
                         file_name = self.sanitize_file_name(file_name)
                     if not file_name:
                         continue
@@ -283,7 +340,7 @@ class MultiPartParser:
                     except (IndexError, TypeError, ValueError):
                         content_length = None
 
-                    counters = [0] * len(handlers)
+                    counters[:] = self._zero_counters
                     uploaded_file = False
                     try:
                         for handler in handlers:
@@ -299,32 +356,19 @@ class MultiPartParser:
                             except StopFutureHandlers:
                                 break
 
-                        for chunk in field_stream:
-                            if transfer_encoding == "base64":
-                                # We only special-case base64 transfer encoding
-                                # We should always decode base64 chunks by
-                                # multiple of 4, ignoring whitespace.
-
-                                stripped_chunk = b"".join(chunk.split())
-
-                                remaining = len(stripped_chunk) % 4
-                                while remaining != 0:
-                                    over_chunk = field_stream.read(4 - remaining)
-                                    if not over_chunk:
-                                        break
-                                    stripped_chunk += b"".join(over_chunk.split())
-                                    remaining = len(stripped_chunk) % 4
-
-                                try:
-                                    chunk = base64.b64decode(stripped_chunk)
-                                except Exception as exc:
-                                    # Since this is only a chunk, any error is
-                                    # an unfixable error.
-                                    raise MultiPartParserError(
-                                        "Could not decode base64 data."
-                                    ) from exc
-
-                            for i, handler in enumerate(handlers):
+                        # We only special-case base64 transfer encoding. The
+                        # choice is made once per part, not once per chunk.
+                        if transfer_encoding == "base64":
+                            chunks = iter_base64_chunks(field_stream)
+                        else:
+                            chunks = field_stream
+
+                        for chunk in chunks:
+                            if self._pool is not None:
+                                self._receive_data_chunk_staged(chunk, counters)
+                                continue
+
+                            for i, handler in self._handlers_enum:
                                 chunk_length = len(chunk)
                                 chunk = handler.receive_data_chunk(chunk, counters[i])
                                 counters[i] += chunk_length
@@ -362,17 +406,51 @@ class MultiPartParser:
         # Signal that the upload has completed.
         # any() shortcircuits if a handler's upload_complete() returns a value.
         any(handler.upload_complete() for handler in handlers)
+        self._post = QueryDict(mutable=True)
+        for field_name, values in post_lists.items():
+            self._post.setlist(field_name, values)
         self._post._mutable = False
+        if self._files is None:
+            self._files = MultiValueDict()
         return self._post, self._files
 
+    def _receive_data_chunk_staged(self, chunk, counters):
+        """
+        Feed a chunk through the handlers stage by stage, running the handlers
+        of a parallel stage concurrently on the thread pool.
+        """
+        for stage in self._handler_stages:
+            chunk_length = len(chunk)
+            if len(stage) == 1:
+                ((i, handler),) = stage
+                chunk = handler.receive_data_chunk(chunk, counters[i])
+            else:
+                futures = [
+                    self._pool.submit(handler.receive_data_chunk, chunk, counters[i])
+                    for i, handler in stage
+                ]
+                # Let every handler finish, then collect every result so an
+                # exception from any of them is raised, not just the first.
+                wait(futures)
+                results = [future.result() for future in futures]
+                if any(result is None for result in results):
+                    chunk = None
+            for i, _ in stage:
+                counters[i] += chunk_length
+            if chunk is None:
+                # Don't continue if the chunk received by the handler is None.
+                break
+
     def handle_file_complete(self, old_field_name, counters):
         """
         Handle all the signaling that takes place when a file is complete.
         """
-        for i, handler in enumerate(self._upload_handlers):
+        for i, handler in self._handlers_enum:
             file_obj = handler.file_complete(counters[i])
             if file_obj:
                 # If it returns a file object, then set the files dict.
+                if self._files is None:
+                    self._files = MultiValueDict()
                 self._files.appendlist(
                     force_str(old_field_name, self._encoding, errors="replace"),
                     file_obj,
@@ -393,10 +471,16 @@ class MultiPartParser:
         resulting filename should still be considered as untrusted user input.
         """
         file_name = html.unescape(file_name)
-        file_name = file_name.rsplit("/")[-1]
-        file_name = file_name.rsplit("\\")[-1]
+        # Keep only what follows the last path separator of either kind.
+        cut = max(file_name.rfind("/"), file_name.rfind("\\"))
+        if cut >= 0:
+            file_name = file_name[cut + 1 :]
         # Remove non-printable characters.
-        file_name = "".join([char for char in file_name if char.isprintable()])
+        if not file_name.isprintable():
+            file_name = file_name.translate(_NONPRINTABLE_TABLE)
+            if not file_name.isprintable():
+                # Only characters outside the table's range can remain.
+                file_name = "".join([char for char in file_name if char.isprintable()])
 
         if file_name in {"", ".", ".."}:
             return None
@@ -436,7 +520,7 @@ class LazyStream:
         self.length = length
         self.position = 0
         self._remaining = length
-        self._unget_history = []
+        self._unget_history = collections.deque(maxlen=50)
 
     def tell(self):
         return self.position
@@ -479,7 +563,7 @@ class LazyStream:
             self._leftover = b""
         else:
             output = next(self._producer)
-            self._unget_history = []
+            self._unget_history.clear()
         self.position += len(output)
         return output
 
@@ -516,16 +600,8 @@ class LazyStream:
         infinite loop of some sort. This is usually caused by a
         maliciously-malformed MIME request.
         """
-        self._unget_history = [num_bytes] + self._unget_history[:49]
-        number_equal = len(
-            [
-                current_number
-                for current_number in self._unget_history
-                if current_number == num_bytes
-            ]
-        )
-
-        if number_equal > 40:
+        self._unget_history.appendleft(num_bytes)
+        if self._unget_history.count(num_bytes) > 40:
             raise SuspiciousMultipartForm(
                 "The multipart parser got stuck, which shouldn't happen with"
                 " normal uploaded files. Check for malicious upload activity;"
@@ -662,18 +738,26 @@ class BoundaryIter:
         else:
             end = index
             next = index + len(self._boundary)
-            # backup over CRLF
-            last = max(0, end - 1)
-            if data[last : last + 1] == b"\n":
+            # backup over CRLF, checking in place rather than slicing.
+            if data.endswith(b"\n", 0, end):
                 end -= 1
-            last = max(0, end - 1)
-            if data[last : last + 1] == b"\r":
+            if data.endswith(b"\r", 0, end):
                 end -= 1
             return end, next
 
 
 def exhaust(stream_or_iterable):
     """Exhaust an iterator or stream."""
+    readinto = getattr(stream_or_iterable, "readinto", None)
+    if readinto is not None:
+        # Drain file-like objects into a shared scratch buffer rather than
+        # allocating a new bytes object for every read.
+        try:
+            while readinto(_EXHAUST_BUFFER):
+                pass
+        except InputStreamExhausted:
+            pass
+        return
     try:
         iterator = iter(stream_or_iterable)
     except TypeError:
@@ -681,6 +765,59 @@ def exhaust(stream_or_iterable):
     collections.deque(iterator, maxlen=0)  # consume iterator quickly.
 
 
+def decode_base64_chunk(chunk, leftover=b""):
+    """
+    Decode a chunk of base64 data, ignoring whitespace.
+
+    Only the longest prefix of ``leftover + chunk`` that is a multiple of 4
+    bytes is decoded. Return a tuple of the decoded bytes and the unaligned
+    tail, which should be passed back as ``leftover`` with the next chunk.
+    """
+    # translate() returns the chunk itself when it holds no whitespace, so
+    # clean, aligned chunks are decoded straight from the original buffer.
+    stripped_chunk = chunk.translate(None, ASCII_WHITESPACE)
+    if leftover:
+        stripped_chunk = leftover + stripped_chunk
+    remaining = len(stripped_chunk) % 4
+    if remaining:
+        stripped_chunk, leftover = (
+            stripped_chunk[:-remaining],
+            stripped_chunk[-remaining:],
+        )
+    else:
+        leftover = b""
+    try:
+        decoded = base64.b64decode(stripped_chunk)
+    except Exception as exc:
+        # Since this is only a chunk, any error is an unfixable error.
+        raise MultiPartParserError("Could not decode base64 data.") from exc
+    return decoded, leftover
+
+
+def iter_base64_chunks(chunks):
+    """
+    Yield the decoded data of an iterable of base64 chunks.
+
+    We should always decode base64 chunks by multiple of 4, ignoring
+    whitespace. The unaligned tail of each chunk is carried over to the next
+    one rather than read ahead from the stream.
+    """
+    leftover = b""
+    for chunk in chunks:
+        decoded, leftover = decode_base64_chunk(chunk, leftover)
+        if decoded:
+            yield decoded
+    if leftover:
+        # The field ended on a partial base64 quantum. Decode it as is, since
+        # b64decode() discards non-alphabet bytes and may still succeed.
+        try:
+            decoded = base64.b64decode(leftover)
+        except binascii.Error as exc:
+            raise MultiPartParserError("Could not decode base64 data.") from exc
+        if decoded:
+            yield decoded
+
+
 def parse_boundary_stream(stream, max_header_size):
     """
     Parse one and exactly one stream that encapsulates a boundary.